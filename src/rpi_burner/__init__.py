@@ -9,6 +9,7 @@ from rpi_burner.cloud_init import (
 from rpi_burner.disk_detector import (
     DiskDetectorError,
     get_disk_info,
+    get_disk_infos,
     list_external_disks,
 )
 from rpi_burner.disk_writer import (
@@ -26,6 +27,7 @@ __all__ = [
     "CloudInitError",
     "list_external_disks",
     "get_disk_info",
+    "get_disk_infos",
     "burn_image",
     "eject_disk",
     "unmount_disk",
@@ -0,0 +1,34 @@
+"""Run diskutil through subprocess's posix_spawn fast path."""
+import plistlib
+import subprocess
+from typing import Any
+
+DISKUTIL = "/usr/sbin/diskutil"
+
+
+def run_diskutil(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run diskutil with captured text output, raising CalledProcessError on failure.
+
+    subprocess only uses posix_spawn (rather than fork + exec) for an absolute
+    executable path with close_fds=False. Leaving fds open is safe because
+    Python creates them non-inheritable by default.
+    """
+    return subprocess.run(
+        [DISKUTIL, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        close_fds=False,
+    )
+
+
+def run_diskutil_plist(*args: str) -> dict[str, Any]:
+    """Run a `diskutil ... -plist` command and parse its raw stdout bytes."""
+    result = subprocess.run(
+        [DISKUTIL, *args],
+        capture_output=True,
+        check=True,
+        close_fds=False,
+    )
+    plist_data: dict[str, Any] = plistlib.loads(result.stdout)
+    return plist_data
@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.prompt import Prompt
 from rich.table import Table
 
@@ -80,6 +80,15 @@ def list_disks():
         console.print("[yellow]No removable disks found.[/yellow]")
         return
 
+    if not console.is_terminal:
+        # Piped output: skip Rich's table layout and emit tab-separated rows.
+        for disk in disks:
+            click.echo(
+                f"{disk.device_path}\t{disk.volume_name or 'Untitled'}\t"
+                f"{disk.size_gb:.2f}\t{disk.file_system}"
+            )
+        return
+
     table = Table(title="Removable Disks")
     table.add_column("Device", style="cyan")
     table.add_column("Name", style="green")
@@ -122,18 +131,30 @@ def burn(
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
-    console.print("\n[bold]Ready to burn:[/bold]")
-    console.print(f"  Image: {image}")
-    console.print(f"  Target: {disk.display_name} ({disk.size_gb:.2f} GB)")
+    # Validate the cloud-config before touching the disk so the post-write steps never wait on it.
+    user_data: bytes | None = None
+    if cloud_init_file:
+        try:
+            user_data = load_cloud_config(cloud_init_file)
+        except CloudInitError as e:
+            console.print(f"[red]Cloud Init error:[/red] {e}")
+            sys.exit(1)
+
+    summary = [
+        "\n[bold]Ready to burn:[/bold]",
+        f"  Image: {image}",
+        f"  Target: {disk.display_name} ({disk.size_gb:.2f} GB)",
+    ]
     if cloud_init_file:
-        console.print(f"  Cloud-Init: {cloud_init_file}")
-    console.print()
+        summary.append(f"  Cloud-Init: {cloud_init_file}")
+    summary.append("")
+    console.print(Group(*summary))
 
-    if not confirm:
-        confirm_text = input('Type "yes" to confirm: ')
-        if confirm_text.lower() != "yes":
-            console.print("[yellow]Cancelled.[/yellow]")
-            sys.exit(0)
+    if not confirm and not click.confirm(
+        f"Erase {disk.device_path} and write the image?", default=False
+    ):
+        console.print("[yellow]Cancelled.[/yellow]")
+        sys.exit(0)
 
     console.print("[yellow]Unmounting disk...[/yellow]")
     try:
@@ -151,7 +172,7 @@ def burn(
 
     console.print("[bold green]Write complete![/bold green]")
 
-    if cloud_init_file:
+    if user_data is not None:
         console.print("[yellow]Adding Cloud Init...[/yellow]")
         try:
             boot_part = get_boot_partition(disk.device_path)
@@ -159,7 +180,6 @@ def burn(
                 console.print("[red]Could not find boot partition[/red]")
             else:
                 mount_point = mount_partition(boot_part)
-                user_data = load_cloud_config(cloud_init_file)
                 write_cloud_init_files(mount_point, user_data)
                 console.print(f"[bold green]Cloud Init files written to {mount_point}[/bold green]")
         except CloudInitError as e:
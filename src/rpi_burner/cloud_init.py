@@ -1,10 +1,25 @@
 """Cloud Init configuration support."""
-import plistlib
+import os
+import re
 import subprocess
 from pathlib import Path
 
 import yaml
 
+from rpi_burner._subproc import run_diskutil, run_diskutil_plist
+from rpi_burner.disk_detector import load_diskutil_list
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+# `diskutil mount` reports e.g. "Volume bootfs on disk4s1 mounted".
+_MOUNTED_VOLUME_RE = re.compile(r"^Volume (.+) on \S+ mounted", re.MULTILINE)
+
+# Partition content types diskutil reports for FAT boot partitions.
+_BOOT_PARTITION_CONTENT = frozenset({"DOS", "FAT32", "msdos", "Windows_FAT_32"})
+
 
 class CloudInitError(Exception):
     pass
@@ -13,49 +28,45 @@ class CloudInitError(Exception):
 def get_boot_partition(device_path: str) -> str | None:
     """Find the boot partition on a disk."""
     try:
-        result = subprocess.run(
-            ["diskutil", "list", "-plist", device_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        plist_data = load_diskutil_list(device_path)
     except subprocess.CalledProcessError:
         return None
 
-    import plistlib
-    plist_data = plistlib.loads(result.stdout.encode())
+    return next(
+        (
+            f"/dev/{partition.get('DeviceIdentifier')}"
+            for disk_info in plist_data.get("AllDisksAndPartitions", [])
+            for partition in disk_info.get("Partitions", [])
+            if partition.get("Content") in _BOOT_PARTITION_CONTENT
+        ),
+        None,
+    )
 
-    all_disks = plist_data.get("AllDisksAndPartitions", [])
-    for disk_info in all_disks:
-        partitions = disk_info.get("Partitions", [])
-        for partition in partitions:
-            content = partition.get("Content", "")
-            if content in ("DOS", "FAT32", "msdos", "Windows_FAT_32"):
-                return f"/dev/{partition.get('DeviceIdentifier')}"
 
-    return None
+def _is_mounted_from(mount_point: Path, partition_path: str) -> bool:
+    try:
+        return os.stat(mount_point).st_dev == os.stat(partition_path).st_rdev
+    except OSError:
+        return False
 
 
 def mount_partition(partition_path: str) -> Path:
     """Mount a partition and return the mount point."""
     try:
-        result = subprocess.run(
-            ["diskutil", "mount", partition_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = run_diskutil("mount", partition_path)
     except subprocess.CalledProcessError:
         pass
+    else:
+        # Volumes usually mount under /Volumes/<name>. Another volume with the same name
+        # may already own that path, so only trust it if it is backed by this partition.
+        match = _MOUNTED_VOLUME_RE.search(result.stdout)
+        if match:
+            mount_point = Path("/Volumes") / match.group(1)
+            if _is_mounted_from(mount_point, partition_path):
+                return mount_point
 
     try:
-        result = subprocess.run(
-            ["diskutil", "info", "-plist", partition_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        plist_data = plistlib.loads(result.stdout.encode())
+        plist_data = run_diskutil_plist("info", "-plist", partition_path)
         mount_point = plist_data.get("MountPoint", "")
         if mount_point:
             return Path(mount_point)
@@ -65,31 +76,32 @@ def mount_partition(partition_path: str) -> Path:
     raise CloudInitError("Could not determine mount point")
 
 
-def write_cloud_init_files(mount_path: Path, user_data: str, meta_data: str = "") -> None:
+def write_cloud_init_files(mount_path: Path, user_data: bytes, meta_data: str = "") -> None:
     """Write cloud-init files to the boot partition."""
     if not mount_path.exists():
         raise CloudInitError(f"Mount point does not exist: {mount_path}")
 
     user_data_path = mount_path / "user-data"
-    user_data_path.write_text(user_data)
+    user_data_path.write_bytes(user_data)
 
     if meta_data:
         meta_data_path = mount_path / "meta-data"
         meta_data_path.write_text(meta_data)
 
 
-def load_cloud_config(config_path: Path) -> str:
-    """Load and validate a cloud-config YAML file."""
+def load_cloud_config(config_path: Path) -> bytes:
+    """Validate a cloud-config YAML file and return its contents unchanged."""
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise CloudInitError(f"Invalid YAML: {e}") from e
+        user_data = config_path.read_bytes()
     except FileNotFoundError:
         raise CloudInitError(f"Config file not found: {config_path}") from None
 
+    try:
+        config = yaml.load(user_data, Loader=_Loader)
+    except yaml.YAMLError as e:
+        raise CloudInitError(f"Invalid YAML: {e}") from e
+
     if not isinstance(config, dict):
         raise CloudInitError("Cloud config must be a YAML dictionary")
 
-    result: str = yaml.dump(config, default_flow_style=False)
-    return result
+    return user_data
@@ -1,8 +1,9 @@
 """Detect mounted removable disks on macOS."""
-import plistlib
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+from rpi_burner._subproc import run_diskutil_plist
 from rpi_burner.models import Disk
 
 
@@ -10,15 +11,25 @@ class DiskDetectorError(Exception):
     pass
 
 
-def list_external_disks() -> list[Disk]:
-    result = subprocess.run(
-        ["diskutil", "list", "-plist", "external", "physical"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+_plist_cache: dict[str, dict[str, Any]] = {}
+
+
+def load_diskutil_list(device_path: str | None = None) -> dict[str, Any]:
+    """Return `diskutil list -plist` output, running diskutil at most once per target."""
+    key = device_path or "external"
+    if key not in _plist_cache:
+        target = [device_path] if device_path else ["external", "physical"]
+        _plist_cache[key] = run_diskutil_plist("list", "-plist", *target)
+    return _plist_cache[key]
+
+
+def clear_plist_cache() -> None:
+    """Forget cached diskutil listings, e.g. after a disk has been rewritten."""
+    _plist_cache.clear()
+
 
-    plist_data = plistlib.loads(result.stdout.encode())
+def list_external_disks() -> list[Disk]:
+    plist_data = load_diskutil_list()
 
     disks = []
     all_disks_and_partitions = plist_data.get("AllDisksAndPartitions", [])
@@ -40,15 +51,13 @@ def list_external_disks() -> list[Disk]:
         ejectable = disk_entry.get("Ejectable", False)
 
         volume_name = ""
-        partitions = disk_info.get("Partitions", [])
         mount_point = ""
+        partitions = disk_info.get("Partitions", [])
         for partition in partitions:
-            vol_name = partition.get("VolumeName", "")
-            if vol_name:
-                volume_name = vol_name
-            part_mount = partition.get("MountPoint", "")
-            if part_mount:
-                mount_point = part_mount
+            volume_name = volume_name or partition.get("VolumeName", "")
+            mount_point = mount_point or partition.get("MountPoint", "")
+            if volume_name and mount_point:
+                break
 
         if not volume_name and mount_point:
             volume_name = Path(mount_point).name
@@ -69,14 +78,11 @@ def list_external_disks() -> list[Disk]:
 
 
 def get_disk_info(device_path: str) -> Disk:
-    result = subprocess.run(
-        ["diskutil", "info", "-plist", device_path],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    for disk in list_external_disks():
+        if disk.device_path == device_path:
+            return disk
 
-    plist_data = plistlib.loads(result.stdout.encode())
+    plist_data = run_diskutil_plist("info", "-plist", device_path)
 
     device_identifier = plist_data.get("DeviceIdentifier", "")
     volume_name = plist_data.get("VolumeName", "") or "Untitled"
@@ -93,3 +99,14 @@ def get_disk_info(device_path: str) -> Disk:
         is_removable=removable,
         is_ejectable=ejectable,
     )
+
+
+def get_disk_infos(device_paths: list[str]) -> list[Disk]:
+    """Look up several disks, running any `diskutil info` fallbacks concurrently."""
+    if not device_paths:
+        return []
+
+    # Warm the shared listing first so the workers don't each run `diskutil list`.
+    load_diskutil_list()
+    with ThreadPoolExecutor(max_workers=len(device_paths)) as pool:
+        return list(pool.map(get_disk_info, device_paths))
@@ -1,7 +1,19 @@
 """Write disk images to removable storage."""
+import fcntl
+import mmap
+import os
+import queue
 import subprocess
+import sys
+import threading
 from pathlib import Path
 
+from rpi_burner._subproc import run_diskutil
+from rpi_burner.disk_detector import clear_plist_cache
+
+BLOCK_SIZE = 16 * 1024 * 1024
+BUFFER_COUNT = 2
+
 
 class DiskWriterError(Exception):
     pass
@@ -10,12 +22,7 @@ class DiskWriterError(Exception):
 def unmount_disk(device_path: str) -> None:
     """Unmount a disk before writing."""
     try:
-        subprocess.run(
-            ["diskutil", "unmountDisk", device_path],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        run_diskutil("unmountDisk", device_path)
     except subprocess.CalledProcessError as e:
         raise DiskWriterError(f"Failed to unmount disk: {e.stderr}") from e
 
@@ -27,33 +34,114 @@ def get_raw_device(device_path: str) -> str:
     return device_path.replace("/dev/disk", "/dev/rdisk")
 
 
+def _write_all(fd: int, view: memoryview) -> None:
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _report_progress(copied: int, total: int) -> None:
+    mib = 1024 * 1024
+    sys.stderr.write(f"\r{copied // mib} MB / {total // mib} MB written")
+    sys.stderr.flush()
+
+
+def _read_blocks(
+    src_fd: int,
+    free: queue.Queue[memoryview | None],
+    filled: queue.Queue[tuple[memoryview, int] | OSError],
+) -> None:
+    try:
+        while (buf := free.get()) is not None:
+            n = os.readv(src_fd, [buf])
+            filled.put((buf, n))
+            if not n:
+                return
+    except OSError as e:
+        filled.put(e)
+
+
+def _copy_threaded(src_fd: int, dst_fd: int, total: int, progress: bool) -> None:
+    """Copy src_fd to dst_fd, reading the next block while the current one is written."""
+    free: queue.Queue[memoryview | None] = queue.Queue()
+    filled: queue.Queue[tuple[memoryview, int] | OSError] = queue.Queue()
+    # Anonymous mmap gives page-aligned buffers, which uncached raw-device writes can
+    # DMA from directly instead of bouncing through a kernel copy.
+    for _ in range(BUFFER_COUNT):
+        free.put(memoryview(mmap.mmap(-1, BLOCK_SIZE)))
+
+    reader = threading.Thread(target=_read_blocks, args=(src_fd, free, filled), daemon=True)
+    reader.start()
+    copied = 0
+    try:
+        while True:
+            item = filled.get()
+            if isinstance(item, OSError):
+                raise item
+            buf, n = item
+            if not n:
+                break
+            _write_all(dst_fd, buf[:n])
+            free.put(buf)
+            copied += n
+            if progress:
+                _report_progress(copied, total)
+    finally:
+        free.put(None)
+        reader.join()
+
+
+def _full_sync(fd: int) -> None:
+    """Flush to the media itself (not just the drive cache), falling back to fsync."""
+    if not hasattr(fcntl, "F_FULLFSYNC"):
+        os.fsync(fd)
+        return
+    try:
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    except OSError:
+        # Raw device nodes may reject F_FULLFSYNC (ENOTTY/ENOTSUP); fall back as SQLite does.
+        os.fsync(fd)
+
+
+def _burn_image_native(image_path: str, raw_device: str, progress: bool) -> None:
+    total = os.path.getsize(image_path)
+    src_fd = os.open(image_path, os.O_RDONLY)
+    try:
+        dst_fd = os.open(raw_device, os.O_WRONLY)
+        try:
+            # Bypass the unified buffer cache for the device writes; the data is never reread.
+            if hasattr(fcntl, "F_NOCACHE"):
+                fcntl.fcntl(dst_fd, fcntl.F_NOCACHE, 1)
+            _copy_threaded(src_fd, dst_fd, total, progress)
+            _full_sync(dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    if progress:
+        sys.stderr.write("\n")
+
+
 def burn_image(image_path: str, device_path: str, progress: bool = True) -> None:
-    """Burn an image to a disk using dd."""
+    """Burn an image to a disk by copying it block by block to the raw device."""
     image_file = Path(image_path)
     if not image_file.exists():
         raise DiskWriterError(f"Image file not found: {image_path}")
 
     raw_device = get_raw_device(device_path)
 
-    bs = "1m"
-    cmd = ["dd", f"if={image_path}", f"of={raw_device}", f"bs={bs}"]
-    if progress:
-        cmd.append("status=progress")
-
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
+        _burn_image_native(image_path, raw_device, progress)
+    except OSError as e:
         raise DiskWriterError(f"Failed to write image: {e}") from e
+    finally:
+        # The partition table has changed, so earlier diskutil listings are stale.
+        clear_plist_cache()
 
 
 def eject_disk(device_path: str) -> None:
     """Eject a disk after writing."""
     try:
-        subprocess.run(
-            ["diskutil", "eject", device_path],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        run_diskutil("eject", device_path)
     except subprocess.CalledProcessError as e:
         raise DiskWriterError(f"Failed to eject disk: {e.stderr}") from e
@@ -1,8 +1,8 @@
 """Data models for rpi-burner."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Disk:
     device_path: str
     volume_name: str
@@ -10,10 +10,10 @@ class Disk:
     file_system: str
     is_removable: bool
     is_ejectable: bool
+    size_gb: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def size_gb(self) -> float:
-        return self.size_bytes / (1024**3)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "size_gb", self.size_bytes / (1024**3))
 
     @property
     def display_name(self) -> str:
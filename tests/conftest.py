@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+import pytest
+
+from rpi_burner.disk_detector import clear_plist_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_plist_cache():
+    clear_plist_cache()
+    yield
+    clear_plist_cache()
@@ -0,0 +1,31 @@
+"""Tests for the CLI."""
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from rpi_burner.cli import main
+from rpi_burner.models import Disk
+
+
+def test_list_plain_output_when_piped():
+    disks = [Disk("/dev/disk4", "bootfs", 32 * 1024**3, "FDisk_partition_scheme", True, True)]
+
+    with patch("rpi_burner.cli.list_external_disks", return_value=disks):
+        result = CliRunner().invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    assert result.output == "/dev/disk4\tbootfs\t32.00\tFDisk_partition_scheme\n"
+
+
+def test_burn_cancelled_without_confirmation(tmp_path):
+    image = tmp_path / "image.img"
+    image.write_bytes(b"data")
+    disk = Disk("/dev/disk4", "bootfs", 32 * 1024**3, "FDisk_partition_scheme", True, True)
+
+    with patch("rpi_burner.cli.get_disk_info", return_value=disk), \
+            patch("rpi_burner.cli.burn_image") as mock_burn:
+        result = CliRunner().invoke(main, ["burn", str(image), "-d", "/dev/disk4"], input="n\n")
+
+    assert result.exit_code == 0
+    assert "Cancelled" in result.output
+    mock_burn.assert_not_called()
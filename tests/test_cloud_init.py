@@ -0,0 +1,116 @@
+"""Tests for cloud init support."""
+import plistlib
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from rpi_burner.cloud_init import (
+    CloudInitError,
+    get_boot_partition,
+    load_cloud_config,
+    mount_partition,
+)
+
+
+def create_mock_list_plist(partitions: list[dict]) -> bytes:
+    data = {
+        "AllDisksAndPartitions": [
+            {
+                "DeviceIdentifier": "disk4",
+                "Partitions": partitions,
+            }
+        ]
+    }
+    return plistlib.dumps(data)
+
+
+def test_get_boot_partition_finds_fat32():
+    mock_result = MagicMock()
+    mock_result.stdout = create_mock_list_plist([
+        {"DeviceIdentifier": "disk4s1", "Content": "Windows_FAT_32"},
+        {"DeviceIdentifier": "disk4s2", "Content": "Linux"},
+    ])
+
+    with patch("subprocess.run", return_value=mock_result):
+        assert get_boot_partition("/dev/disk4") == "/dev/disk4s1"
+
+
+def test_get_boot_partition_none_without_fat():
+    mock_result = MagicMock()
+    mock_result.stdout = create_mock_list_plist([
+        {"DeviceIdentifier": "disk4s1", "Content": "Linux"},
+    ])
+
+    with patch("subprocess.run", return_value=mock_result):
+        assert get_boot_partition("/dev/disk4") is None
+
+
+def fake_stat(devices: dict[str, tuple[int, int]]):
+    def _stat(path):
+        st_dev, st_rdev = devices[str(path)]
+        return MagicMock(st_dev=st_dev, st_rdev=st_rdev)
+    return _stat
+
+
+def test_mount_partition_uses_mount_output():
+    mock_result = MagicMock()
+    mock_result.stdout = "Volume bootfs on disk4s1 mounted\n"
+    devices = {"/Volumes/bootfs": (41, 0), "/dev/disk4s1": (1, 41)}
+
+    with patch("subprocess.run", return_value=mock_result) as mock_run, \
+            patch("os.stat", side_effect=fake_stat(devices)):
+        mount_point = mount_partition("/dev/disk4s1")
+
+    assert mount_point == Path("/Volumes/bootfs")
+    assert mock_run.call_count == 1
+
+
+def test_mount_partition_ignores_other_volume_with_same_name():
+    mount_result = MagicMock()
+    mount_result.stdout = "Volume bootfs on disk5s1 mounted\n"
+    info_result = MagicMock()
+    info_result.stdout = plistlib.dumps({"MountPoint": "/Volumes/bootfs 1"})
+    # /Volumes/bootfs is a mount point, but for disk4s1 rather than disk5s1.
+    devices = {"/Volumes/bootfs": (41, 0), "/dev/disk5s1": (1, 51)}
+
+    with patch("subprocess.run", side_effect=[mount_result, info_result]), \
+            patch("os.path.ismount", return_value=True), \
+            patch("os.stat", side_effect=fake_stat(devices)):
+        mount_point = mount_partition("/dev/disk5s1")
+
+    assert mount_point == Path("/Volumes/bootfs 1")
+
+
+def test_mount_partition_falls_back_to_diskutil_info():
+    mount_result = MagicMock()
+    mount_result.stdout = "Volume bootfs on disk4s1 mounted\n"
+    info_result = MagicMock()
+    info_result.stdout = plistlib.dumps({"MountPoint": "/Volumes/bootfs 1"})
+
+    with patch("subprocess.run", side_effect=[mount_result, info_result]), \
+            patch("os.stat", side_effect=FileNotFoundError):
+        mount_point = mount_partition("/dev/disk4s1")
+
+    assert mount_point == Path("/Volumes/bootfs 1")
+
+
+def test_load_cloud_config_returns_file_unchanged(tmp_path):
+    config = tmp_path / "config.yaml"
+    content = b"#cloud-config\n# keep me\nusers: []\nhostname: pi\n"
+    config.write_bytes(content)
+
+    assert load_cloud_config(config) == content
+
+
+def test_load_cloud_config_rejects_non_dict(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("- just\n- a list\n")
+
+    with pytest.raises(CloudInitError):
+        load_cloud_config(config)
+
+
+def test_load_cloud_config_missing_file(tmp_path):
+    with pytest.raises(CloudInitError):
+        load_cloud_config(tmp_path / "missing.yaml")
@@ -2,11 +2,16 @@
 import plistlib
 from unittest.mock import patch, MagicMock
 
-from rpi_burner.disk_detector import list_external_disks, get_disk_info, DiskDetectorError
+from rpi_burner.disk_detector import (
+    list_external_disks,
+    get_disk_info,
+    get_disk_infos,
+    DiskDetectorError,
+)
 from rpi_burner.models import Disk
 
 
-def create_mock_diskutil_plist(disks: list[dict]) -> str:
+def create_mock_diskutil_plist(disks: list[dict]) -> bytes:
     data = {
         "AllDisksAndPartitions": [
             {
@@ -22,7 +27,7 @@ def create_mock_diskutil_plist(disks: list[dict]) -> str:
             for disk in disks
         ]
     }
-    return plistlib.dumps(data).decode()
+    return plistlib.dumps(data)
 
 
 def test_list_external_disks_with_sd_card():
@@ -104,7 +109,7 @@ def test_get_disk_info():
         "Removable": True,
         "Ejectable": True,
     }
-    mock_plist = plistlib.dumps(plist_data).decode()
+    mock_plist = plistlib.dumps(plist_data)
 
     mock_result = MagicMock()
     mock_result.stdout = mock_plist
@@ -126,7 +131,7 @@ def test_get_disk_info_volume_name():
         "Removable": True,
         "Ejectable": True,
     }
-    mock_plist = plistlib.dumps(plist_data).decode()
+    mock_plist = plistlib.dumps(plist_data)
 
     mock_result = MagicMock()
     mock_result.stdout = mock_plist
@@ -135,3 +140,77 @@ def test_get_disk_info_volume_name():
         disk = get_disk_info("/dev/disk4")
 
     assert disk.volume_name == "Untitled"
+
+
+def test_list_external_disks_runs_diskutil_once():
+    mock_plist = create_mock_diskutil_plist([
+        {
+            "device_id": "disk4",
+            "size": 32_000_000_000,
+            "partitions": [{"VolumeName": "boot"}],
+        }
+    ])
+
+    mock_result = MagicMock()
+    mock_result.stdout = mock_plist
+
+    with patch("subprocess.run", return_value=mock_result) as mock_run:
+        list_external_disks()
+        disk = get_disk_info("/dev/disk4")
+
+    assert mock_run.call_count == 1
+    assert disk.volume_name == "boot"
+    assert disk.size_bytes == 32_000_000_000
+
+
+def test_get_disk_infos():
+    list_plist = create_mock_diskutil_plist([
+        {
+            "device_id": "disk4",
+            "size": 32_000_000_000,
+            "partitions": [{"VolumeName": "boot"}],
+        }
+    ])
+    info_plist = plistlib.dumps({
+        "DeviceIdentifier": "disk5s1",
+        "VolumeName": "USB",
+        "Size": 8_000_000_000,
+        "Content": "MS-DOS",
+    })
+
+    def fake_run(argv, **kwargs):
+        result = MagicMock()
+        result.stdout = list_plist if "list" in argv else info_plist
+        return result
+
+    with patch("subprocess.run", side_effect=fake_run) as mock_run:
+        disks = get_disk_infos(["/dev/disk4", "/dev/disk5s1"])
+
+    assert [d.device_path for d in disks] == ["/dev/disk4", "/dev/disk5s1"]
+    assert disks[1].volume_name == "USB"
+    assert mock_run.call_count == 2
+
+
+def test_get_disk_infos_empty():
+    assert get_disk_infos([]) == []
+
+
+def test_list_external_disks_uses_first_named_partition():
+    mock_plist = create_mock_diskutil_plist([
+        {
+            "device_id": "disk4",
+            "size": 32_000_000_000,
+            "partitions": [
+                {"VolumeName": "bootfs", "MountPoint": "/Volumes/bootfs"},
+                {"VolumeName": "rootfs"},
+            ],
+        }
+    ])
+
+    mock_result = MagicMock()
+    mock_result.stdout = mock_plist
+
+    with patch("subprocess.run", return_value=mock_result):
+        disks = list_external_disks()
+
+    assert disks[0].volume_name == "bootfs"
@@ -0,0 +1,92 @@
+"""Tests for disk writer."""
+import errno
+import fcntl
+from unittest.mock import ANY, patch
+
+import pytest
+
+from rpi_burner.disk_writer import (
+    BLOCK_SIZE,
+    DiskWriterError,
+    burn_image,
+    get_raw_device,
+)
+
+
+def test_get_raw_device():
+    assert get_raw_device("/dev/disk4") == "/dev/rdisk4"
+    assert get_raw_device("/dev/rdisk4") == "/dev/rdisk4"
+
+
+def test_burn_image_copies_all_blocks(tmp_path):
+    image = tmp_path / "image.img"
+    target = tmp_path / "target"
+    data = bytes(range(256)) * (BLOCK_SIZE // 256) + b"tail"
+    image.write_bytes(data)
+    target.write_bytes(b"")
+
+    burn_image(str(image), str(target), progress=False)
+
+    assert target.read_bytes() == data
+
+
+def test_burn_image_missing_image(tmp_path):
+    with pytest.raises(DiskWriterError):
+        burn_image(str(tmp_path / "missing.img"), str(tmp_path / "target"), progress=False)
+
+
+def test_burn_image_unwritable_device(tmp_path):
+    image = tmp_path / "image.img"
+    image.write_bytes(b"data")
+
+    with pytest.raises(DiskWriterError):
+        burn_image(str(image), str(tmp_path / "no-such-dir" / "target"), progress=False)
+
+
+def test_burn_image_write_error_stops_reader(tmp_path):
+    image = tmp_path / "image.img"
+    target = tmp_path / "target"
+    image.write_bytes(b"x" * (BLOCK_SIZE * 3))
+    target.write_bytes(b"")
+
+    with patch("os.write", side_effect=OSError("device gone")):
+        with pytest.raises(DiskWriterError, match="device gone"):
+            burn_image(str(image), str(target), progress=False)
+
+
+def test_burn_image_syncs_device(tmp_path):
+    image = tmp_path / "image.img"
+    target = tmp_path / "target"
+    image.write_bytes(b"data")
+    target.write_bytes(b"")
+
+    with patch("os.fsync") as mock_fsync, patch("fcntl.fcntl") as mock_fcntl:
+        burn_image(str(image), str(target), progress=False)
+
+    if hasattr(fcntl, "F_FULLFSYNC"):
+        mock_fcntl.assert_any_call(ANY, fcntl.F_FULLFSYNC)
+        mock_fsync.assert_not_called()
+    else:
+        mock_fsync.assert_called_once()
+
+
+def test_burn_image_falls_back_to_fsync_when_full_fsync_fails(tmp_path):
+    image = tmp_path / "image.img"
+    target = tmp_path / "target"
+    image.write_bytes(b"data")
+    target.write_bytes(b"")
+    full_fsync = getattr(fcntl, "F_FULLFSYNC", 51)
+
+    def fake_fcntl(fd, cmd, *args):
+        if cmd == full_fsync:
+            raise OSError(errno.ENOTTY, "Inappropriate ioctl for device")
+        return 0
+
+    with patch.object(fcntl, "F_FULLFSYNC", full_fsync, create=True), \
+            patch("fcntl.fcntl", side_effect=fake_fcntl) as mock_fcntl, \
+            patch("os.fsync") as mock_fsync:
+        burn_image(str(image), str(target), progress=False)
+
+    mock_fcntl.assert_any_call(ANY, full_fsync)
+    mock_fsync.assert_called_once()
+    assert target.read_bytes() == b"data"